@@ -0,0 +1,209 @@
+"""Batched renames through io_uring (Linux only, via liburing-ffi and ctypes)."""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import sys
+from functools import cache
+from pathlib import Path
+
+QUEUE_DEPTH = 128
+IORING_OP_RENAMEAT = 35
+
+# Soname of liburing-ffi 2.x; loading it directly avoids find_library,
+# which runs ldconfig and the compiler to search for the library
+LIBURING_SONAME = "liburing-ffi.so.2"
+
+
+class _Ring(ctypes.Structure):
+    """Opaque storage for struct io_uring (generously oversized)."""
+
+    _fields_ = [("_storage", ctypes.c_uint64 * 64)]
+
+
+class _Cqe(ctypes.Structure):
+    """Leading fields of struct io_uring_cqe."""
+
+    _fields_ = [
+        ("user_data", ctypes.c_uint64),
+        ("res", ctypes.c_int32),
+        ("flags", ctypes.c_uint32),
+    ]
+
+
+@cache
+def _load_liburing() -> ctypes.CDLL | None:
+    """
+    Load liburing-ffi, which exports the inline prep helpers as real symbols.
+
+    Called on first use rather than at import, so runs that never rename
+    don't pay for the library search. The result is cached.
+
+    Returns:
+        The loaded library, or None on non-Linux systems or when it isn't installed
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        lib = ctypes.CDLL(LIBURING_SONAME)
+    except OSError:
+        name = ctypes.util.find_library("uring-ffi")
+        if name is None:
+            return None
+
+        try:
+            lib = ctypes.CDLL(name)
+        except OSError:
+            return None
+
+    ring_p = ctypes.POINTER(_Ring)
+    cqe_p = ctypes.POINTER(_Cqe)
+
+    lib.io_uring_queue_init.argtypes = [ctypes.c_uint, ring_p, ctypes.c_uint]
+    lib.io_uring_queue_init.restype = ctypes.c_int
+    lib.io_uring_queue_exit.argtypes = [ring_p]
+    lib.io_uring_queue_exit.restype = None
+    lib.io_uring_get_probe_ring.argtypes = [ring_p]
+    lib.io_uring_get_probe_ring.restype = ctypes.c_void_p
+    lib.io_uring_opcode_supported.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    lib.io_uring_opcode_supported.restype = ctypes.c_int
+    lib.io_uring_free_probe.argtypes = [ctypes.c_void_p]
+    lib.io_uring_free_probe.restype = None
+    lib.io_uring_get_sqe.argtypes = [ring_p]
+    lib.io_uring_get_sqe.restype = ctypes.c_void_p
+    lib.io_uring_prep_renameat.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_uint,
+    ]
+    lib.io_uring_prep_renameat.restype = None
+    lib.io_uring_sqe_set_data64.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+    lib.io_uring_sqe_set_data64.restype = None
+    lib.io_uring_submit.argtypes = [ring_p]
+    lib.io_uring_submit.restype = ctypes.c_int
+    lib.io_uring_wait_cqe.argtypes = [ring_p, ctypes.POINTER(cqe_p)]
+    lib.io_uring_wait_cqe.restype = ctypes.c_int
+    lib.io_uring_cqe_seen.argtypes = [ring_p, cqe_p]
+    lib.io_uring_cqe_seen.restype = None
+
+    return lib
+
+
+def _supports_renameat(liburing: ctypes.CDLL, ring: _Ring) -> bool:
+    """Check whether the running kernel implements IORING_OP_RENAMEAT (Linux 5.11+)."""
+    probe = liburing.io_uring_get_probe_ring(ctypes.byref(ring))
+    if not probe:
+        return False
+
+    try:
+        return bool(liburing.io_uring_opcode_supported(probe, IORING_OP_RENAMEAT))
+    finally:
+        liburing.io_uring_free_probe(probe)
+
+
+def rename_batch(rename_plan: list[tuple[Path, Path]]) -> list[int] | None:
+    """
+    Rename files by submitting renameat requests to io_uring in batches.
+
+    Each parent directory is opened once with O_PATH, so the kernel resolves
+    only the final name of every path.
+
+    Args:
+        rename_plan: List of (old_path, new_path) tuples
+
+    Returns:
+        errno for each operation (0 on success), in plan order,
+        or None if io_uring can't be used and the caller should rename serially.
+        If the ring fails part way, the list only covers the operations that
+        reached the kernel; the rest were not attempted.
+    """
+    if not rename_plan:
+        return None
+
+    liburing = _load_liburing()
+    if liburing is None:
+        return None
+
+    ring = _Ring()
+    if liburing.io_uring_queue_init(QUEUE_DEPTH, ctypes.byref(ring), 0) < 0:
+        return None
+
+    dir_fds: dict[Path, int] = {}
+
+    try:
+        if not _supports_renameat(liburing, ring):
+            return None
+
+        try:
+            for old_path, new_path in rename_plan:
+                for parent in (old_path.parent, new_path.parent):
+                    if parent not in dir_fds:
+                        dir_fds[parent] = os.open(parent, os.O_PATH | os.O_DIRECTORY)
+        except OSError:
+            return None
+
+        results: list[int] = []
+        cqe = ctypes.POINTER(_Cqe)()
+
+        for start in range(0, len(rename_plan), QUEUE_DEPTH):
+            batch = rename_plan[start : start + QUEUE_DEPTH]
+            # Keep the encoded names alive until the requests are submitted
+            names = []
+
+            for index, (old_path, new_path) in enumerate(batch):
+                old_name = os.fsencode(old_path.name)
+                new_name = os.fsencode(new_path.name)
+                names.append((old_name, new_name))
+
+                sqe = liburing.io_uring_get_sqe(ctypes.byref(ring))
+                liburing.io_uring_prep_renameat(
+                    sqe,
+                    dir_fds[old_path.parent],
+                    old_name,
+                    dir_fds[new_path.parent],
+                    new_name,
+                    0,
+                )
+                liburing.io_uring_sqe_set_data64(sqe, index)
+
+            # Requests are consumed in order, so only a prefix of the batch
+            # may have been submitted; the caller renames the rest
+            submitted = liburing.io_uring_submit(ctypes.byref(ring))
+            if submitted <= 0:
+                break
+
+            batch_results: list[int | None] = [None] * submitted
+            pending = submitted
+
+            while pending:
+                ret = liburing.io_uring_wait_cqe(ctypes.byref(ring), ctypes.byref(cqe))
+                if ret == -errno.EINTR:
+                    continue
+                if ret < 0:
+                    break
+
+                batch_results[cqe.contents.user_data] = -cqe.contents.res
+                liburing.io_uring_cqe_seen(ctypes.byref(ring), cqe)
+                pending -= 1
+
+            if pending:
+                # The renames still in flight may or may not have happened
+                results.extend(-ret if err is None else err for err in batch_results)
+                break
+
+            results.extend(batch_results)
+
+            if submitted < len(batch):
+                break
+
+        return results
+
+    finally:
+        for fd in dir_fds.values():
+            os.close(fd)
+        liburing.io_uring_queue_exit(ctypes.byref(ring))
@@ -1,10 +1,32 @@
 import argparse
 import os
+import string
 import sys
-from datetime import datetime
+import time
+import unicodedata
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from importlib.metadata import PackageNotFoundError, version
+from itertools import count
+from operator import attrgetter
 from pathlib import Path
 
+from bulk_rename._uring import rename_batch
+
+# Below this many operations a thread pool costs more than it saves
+MIN_PARALLEL_OPS = 8
+
+# Maximum number of backup lines joined into a single write
+BACKUP_CHUNK_ROWS = 65_536
+
+# Preview lines written at once when stdout is a terminal
+PREVIEW_CHUNK_LINES = 1000
+
+# Answers accepted by confirm_action
+_YES = frozenset({"y", "yes"})
+
 
 def generate_new_name(pattern: str, index: int, extension: str) -> str:
     """
@@ -26,20 +48,95 @@ def generate_new_name(pattern: str, index: int, extension: str) -> str:
         >>> generate_new_name("file_{:03d}", 1, "txt")
         "file_001.txt"
     """
+    validate_index(index)
+
+    base_name = pattern.format(index)
+    return f"{base_name}.{extension}"
+
+
+def validate_index(index: int) -> None:
+    """
+    Check that an index can be used for numbering files.
+
+    Args:
+        index: The file index to check
+
+    Raises:
+        TypeError: If index is not an integer.
+        ValueError: If index is negative.
+    """
     if not isinstance(index, int):
         raise TypeError(f"Index must be int, got {type(index).__name__}")
 
     if index < 0:
         raise ValueError(f"Index must be non-negative, got {index}")
 
-    base_name = pattern.format(index)
-    return f"{base_name}.{extension}"
+
+def _generate_new_name_fast(prefix: str, spec: str, suffix: str, index: int, extension: str) -> str:
+    """Build a filename from a pre-split pattern, assuming the index is already validated."""
+    return f"{prefix}{format(index, spec)}{suffix}.{extension}"
+
+
+def _generate_new_name_bound(format_base: Callable[[int], str], index: int, extension: str) -> str:
+    """Build a filename with a pre-bound pattern.format, assuming the index is already validated."""
+    return f"{format_base(index)}.{extension}"
+
+
+def compile_pattern(pattern: str) -> Callable[[int, str], str]:
+    """
+    Parse a naming pattern once and return a function that builds filenames with it.
+
+    Patterns with a single positional placeholder are split into a literal
+    prefix, format spec and literal suffix, so building a name skips
+    re-parsing the pattern. Anything else goes through a pre-bound
+    pattern.format. The index is not validated; see validate_index.
+
+    Args:
+        pattern: A format pattern containing a placeholder (e.g., "file_{:03d}")
+
+    Returns:
+        Function mapping (index, extension) to the new filename
+
+    Example:
+        >>> compile_pattern("file_{:03d}")(7, "txt")
+        "file_007.txt"
+    """
+    fallback = partial(_generate_new_name_bound, pattern.format)
+
+    try:
+        parsed = list(string.Formatter().parse(pattern))
+    except ValueError:
+        return fallback
+
+    field_positions = [
+        i for i, (_, field_name, _, _) in enumerate(parsed) if field_name is not None
+    ]
+
+    if len(field_positions) != 1:
+        return fallback
+
+    position = field_positions[0]
+    _, field_name, spec, conversion = parsed[position]
+
+    if field_name not in {"", "0"} or conversion is not None or "{" in spec:
+        return fallback
+
+    prefix = "".join(literal for literal, _, _, _ in parsed[: position + 1])
+    suffix = "".join(literal for literal, _, _, _ in parsed[position + 1 :])
+
+    return partial(_generate_new_name_fast, prefix, spec, suffix)
 
 
 def find_files(directory: Path, extension: str) -> list[Path]:
     """
     Find all files with specified extension in directory.
 
+    Uses a single os.scandir pass; entry types come from the directory
+    listing, so matching files normally need no extra stat. Names are
+    compared with os.path.normcase, so the extension matches regardless
+    of case on Windows, as Path.glob does. A missing directory, or a path
+    that is not a directory, yields no files.
+
     Args:
         directory: Path to the directory to search
         extension: File extension without dot (e.g., "mp4")
@@ -51,7 +148,18 @@ def find_files(directory: Path, extension: str) -> list[Path]:
         >>> find_files(Path("./videos"), "mp4")
         [Path("video1.mp4"), Path("video2.mp4")]
     """
-    return list(directory.glob(f"*.{extension}"))
+    normcase = os.path.normcase
+    suffix = normcase(f".{extension}")
+
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if normcase(entry.name).endswith(suffix) and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 def sort_files(files: list[Path]) -> list[Path]:
@@ -64,7 +172,7 @@ def sort_files(files: list[Path]) -> list[Path]:
     Returns:
         Sorted list of file paths
     """
-    return sorted(files, key=lambda f: f.name)
+    return sorted(files, key=attrgetter("name"))
 
 
 def generate_rename_plan(
@@ -87,18 +195,50 @@ def generate_rename_plan(
         [(Path("a.mp4"), Path("video_001.mp4")),
          (Path("b.mp4"), Path("video_002.mp4"))]
     """
-    plan = []
+    if files:
+        # Indices only grow from here, so checking the first one covers all
+        validate_index(start_index)
+
+    make_name = compile_pattern(pattern)
+
+    # Slice parent prefixes and extensions out of the path strings instead of
+    # going through Path.parent / Path.suffix, which build or re-split paths.
+    # Comprehensions and map() run fewer bytecodes per item than append loops
+    names = [old_path.name for old_path in files]
+    parent_prefixes = list(map(str.removesuffix, map(os.fspath, files), names))
+    # Same rule as Path.suffix: a leading or trailing dot is not an extension
+    extensions = [
+        name[dot + 1 :] if 0 < (dot := name.rfind(".")) < len(name) - 1 else "" for name in names
+    ]
+
+    return [
+        (old_path, Path(prefix + make_name(index, extension)))
+        for index, old_path, prefix, extension in zip(
+            count(start_index), files, parent_prefixes, extensions
+        )
+    ]
+
+
+def list_directory(directory: Path) -> set[str]:
+    """
+    List entry names in a directory with a single scan.
 
-    for index, old_path in enumerate(files, start=start_index):
-        parent_dir = old_path.parent
-        extension = old_path.suffix[1:]
+    Args:
+        directory: Path to the directory to list
 
-        new_filename = generate_new_name(pattern, index, extension)
-        new_path = parent_dir / new_filename
+    Returns:
+        Set of entry names, empty if the directory doesn't exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
 
-        plan.append((old_path, new_path))
 
-    return plan
+def _fold_name(name: str) -> str:
+    """Fold a filename so names differing only in case or Unicode normalization match."""
+    return unicodedata.normalize("NFC", name).casefold()
 
 
 def validate_rename_plan(rename_plan: list[tuple[Path, Path]]) -> list[tuple[Path, Path, str]]:
@@ -114,25 +254,86 @@ def validate_rename_plan(rename_plan: list[tuple[Path, Path]]) -> list[tuple[Pat
     Checks:
         - Source file is not found
         - Target file already exists
+
+    Directories holding more than one source are listed once with os.scandir,
+    so most existence checks become set lookups instead of one stat per path.
+    The listing is compared exactly for sources and with folded names for
+    targets; whenever it can't settle a check, the filesystem is asked.
     """
     conflicts = []
 
+    def parent_of(path: Path) -> str:
+        # Slicing the name off the path string avoids building a Path per check
+        return os.fspath(path).removesuffix(path.name)
+
+    pairs_per_dir = Counter(parent_of(old_path) for old_path, _ in rename_plan)
+    listings: dict[str, set[str]] = {}
+    folded_listings: dict[str, set[str]] = {}
+
+    def listing(parent: str) -> set[str]:
+        if parent not in listings:
+            listings[parent] = list_directory(Path(parent or os.curdir))
+
+        return listings[parent]
+
+    def folded_listing(parent: str) -> set[str]:
+        if parent not in folded_listings:
+            folded_listings[parent] = {_fold_name(name) for name in listing(parent)}
+
+        return folded_listings[parent]
+
+    def source_exists(path: Path) -> bool:
+        parent = parent_of(path)
+
+        if pairs_per_dir[parent] < 2:
+            return path.exists()
+
+        # An exact match proves the file is there
+        return path.name in listing(parent) or path.exists()
+
+    def target_exists(path: Path) -> bool:
+        parent = parent_of(path)
+
+        if pairs_per_dir[parent] < 2:
+            return path.exists()
+
+        # On a case-insensitive filesystem the target may be listed under a
+        # different case, so only a name missing from the folded listing is
+        # known to be free. Whether a folded match is taken is up to the filesystem
+        return _fold_name(path.name) in folded_listing(parent) and path.exists()
+
+    # In a single-directory plan (the CLI case), one set operation on folded
+    # names can prove that no target exists yet, so only the sources need checking
+    targets_free = False
+
+    if len(pairs_per_dir) == 1 and len(rename_plan) > 1:
+        (parent,) = pairs_per_dir
+
+        if all(parent_of(new_path) == parent for _, new_path in rename_plan):
+            targets_free = folded_listing(parent).isdisjoint(
+                _fold_name(new_path.name) for _, new_path in rename_plan
+            )
+
     for old_path, new_path in rename_plan:
-        if not old_path.exists():
+        if not source_exists(old_path):
             conflicts.append((old_path, new_path, "Source file is not found"))
 
-        elif new_path.exists():
+        elif not targets_free and target_exists(new_path):
             conflicts.append((old_path, new_path, "Target file already exists"))
 
     return conflicts
 
 
-def show_preview(rename_plan: list[tuple[Path, Path]]) -> None:
+def show_preview(
+    rename_plan: list[tuple[Path, Path]],
+    conflicts: list[tuple[Path, Path, str]] | None = None,
+) -> None:
     """
     Display preview of rename operations.
 
     Args:
         rename_plan: List of (old_path, new_path) tuples
+        conflicts: Result of validate_rename_plan for this plan (validated here if None)
 
     Returns:
         None (prints to console)
@@ -141,17 +342,29 @@ def show_preview(rename_plan: list[tuple[Path, Path]]) -> None:
         ✅ a.mp4 -> video_001.mp4
         ❌ b.mp4 -> video_002.mp4 [Target file already exists]
     """
-    conflicts = validate_rename_plan(rename_plan)
+    if conflicts is None:
+        conflicts = validate_rename_plan(rename_plan)
 
-    conflict_dict = {(old, new): error for old, new, error in conflicts}
+    # Each source appears once in a plan, so it alone identifies the operation
+    conflict_errors = {old: error for old, _, error in conflicts}
+
+    # Write in one go, or in chunks on a terminal so long previews show progress
+    chunk_lines = PREVIEW_CHUNK_LINES if sys.stdout.isatty() else None
+    lines = []
 
     for old_path, new_path in rename_plan:
-        if (old_path, new_path) in conflict_dict:
-            error_msg = conflict_dict[(old_path, new_path)]
-            print(f"❌ {old_path} -> {new_path} [{error_msg}]")
+        error_msg = conflict_errors.get(old_path)
+        if error_msg is not None:
+            lines.append(f"❌ {old_path} -> {new_path} [{error_msg}]\n")
 
         else:
-            print(f"✅ {old_path} -> {new_path}")
+            lines.append(f"✅ {old_path} -> {new_path}\n")
+
+        if len(lines) == chunk_lines:
+            sys.stdout.write("".join(lines))
+            lines.clear()
+
+    sys.stdout.write("".join(lines))
 
 
 def confirm_action(prompt: str = "Proceed? (y/n): ") -> bool:
@@ -165,7 +378,7 @@ def confirm_action(prompt: str = "Proceed? (y/n): ") -> bool:
         True if user confirms, False otherwise
     """
     user_input = input(prompt)
-    return user_input.strip().lower() in {"y", "yes"}
+    return user_input.strip().lower() in _YES
 
 
 def save_backup(rename_plan: list[tuple[Path, Path]], backup_dir: Path) -> Path:
@@ -183,41 +396,150 @@ def save_backup(rename_plan: list[tuple[Path, Path]], backup_dir: Path) -> Path:
         old_name.mp4 -> new_name.mp4
         another.mp4 -> another_001.mp4
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
 
     backup_path = backup_dir / f"backup_{timestamp}.txt"
 
-    with backup_path.open("w", encoding="utf-8") as backup:
-        for old_path, new_path in rename_plan:
-            backup.write(f"{old_path} -> {new_path}\n")
+    # Write encoded chunks straight to the file descriptor, bypassing the
+    # buffering and incremental encoding layers of a text-mode file object
+    fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+
+    try:
+        # One write per chunk keeps large plans from building a single huge string
+        for start in range(0, len(rename_plan), BACKUP_CHUNK_ROWS):
+            chunk = rename_plan[start : start + BACKUP_CHUNK_ROWS]
+            # A list lets join size the result in one pass (a generator is copied first)
+            text = "".join([f"{old_path} -> {new_path}\n" for old_path, new_path in chunk])
+            data = memoryview(text.encode("utf-8"))
+
+            # os.write may write less than asked for
+            while data:
+                data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
 
     return backup_path
 
 
-def execute_rename(rename_plan: list[tuple[Path, Path]]) -> None:
+def rename_file(old_path: Path, new_path: Path) -> int:
+    """
+    Rename a single file.
+
+    Args:
+        old_path: Current file path
+        new_path: Target file path
+
+    Returns:
+        0 on success, otherwise the errno of the failed rename
+    """
+    try:
+        os.rename(old_path, new_path)
+    except OSError as e:
+        return e.errno
+
+    return 0
+
+
+def apply_plan(rename_plan: list[tuple[Path, Path]], threads: int = 20) -> list[int]:
+    """
+    Rename every file in a plan, without validating it or printing anything.
+
+    On Linux with liburing installed, renames are batched through io_uring.
+    Otherwise they are spread over a thread pool (os.rename releases the GIL),
+    or issued one by one for small plans.
+
+    Args:
+        rename_plan: List of (old_path, new_path) tuples
+        threads: Maximum number of worker threads used when io_uring is unavailable
+
+    Returns:
+        errno for each operation (0 on success), in plan order
+    """
+    # io_uring covers a prefix of the plan: all of it, or whatever was
+    # submitted before the ring failed. The rest is renamed here
+    errors = rename_batch(rename_plan) or []
+    remaining = rename_plan[len(errors) :]
+
+    if threads > 1 and len(remaining) >= MIN_PARALLEL_OPS:
+        with ThreadPoolExecutor(max_workers=min(threads, len(remaining))) as pool:
+            return errors + list(pool.map(rename_file, *zip(*remaining)))
+
+    return errors + [rename_file(old_path, new_path) for old_path, new_path in remaining]
+
+
+def execute_rename(
+    rename_plan: list[tuple[Path, Path]],
+    conflicts: list[tuple[Path, Path, str]] | None = None,
+    threads: int = 20,
+) -> None:
     """
     Execute rename operations after validation, skipping conflics, and display results.
 
     Args:
         rename_plan: List of (old_path, new_path) tuples
+        conflicts: Result of validate_rename_plan for this plan (validated here if None)
+        threads: Maximum number of worker threads used when io_uring is unavailable
 
     Returns:
         None (prints to console)
 
     Example output:
-        ✅ a.mp4 -> video_001.mp4
         ⚠️ [SKIPPED] b.mp4 -> video_002.mp4 [Target file already exists]
+        ⚠️ [SKIPPED] c.mp4 -> video_003.mp4 [Permission denied]
+
+    The remaining operations are renamed with apply_plan.
     """
-    conflicts = validate_rename_plan(rename_plan)
+    if conflicts is None:
+        conflicts = validate_rename_plan(rename_plan)
+
+    # Each source appears once in a plan, so it alone identifies the operation
+    conflict_errors = {old: error for old, _, error in conflicts}
 
-    conflict_dict = {(old, new): error for old, new, error in conflicts}
+    effective_ops = []
+    skipped_lines = []
 
     for old_path, new_path in rename_plan:
-        if (old_path, new_path) in conflict_dict:
-            error_msg = conflict_dict[(old_path, new_path)]
-            print(f"⚠️ [SKIPPED] {old_path} -> {new_path} [{error_msg}]")
+        error_msg = conflict_errors.get(old_path)
+        if error_msg is not None:
+            skipped_lines.append(f"⚠️ [SKIPPED] {old_path} -> {new_path} [{error_msg}]\n")
         else:
-            old_path.rename(new_path)
+            effective_ops.append((old_path, new_path))
+
+    sys.stdout.write("".join(skipped_lines))
+
+    errors = apply_plan(effective_ops, threads)
+
+    failed_lines = [
+        f"⚠️ [SKIPPED] {old_path} -> {new_path} [{os.strerror(err)}]\n"
+        for (old_path, new_path), err in zip(effective_ops, errors)
+        if err
+    ]
+
+    sys.stdout.write("".join(failed_lines))
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command-line value as an integer of at least 1.
+
+    Args:
+        value: Raw argument string
+
+    Returns:
+        The parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer or is below 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+
+    return number
 
 
 def parse_args():
@@ -231,6 +553,7 @@ def parse_args():
     - --pattern / -p (str, required): The naming pattern for the new files (e.g., 'file_{:03d}').
     - --extension / -e (str, required): The file extension to filter files by (e.g., 'mp4').
     - --start / -s (int, optional): The starting index for numbering files (default is 1).
+    - --threads / -t (int, optional): The number of renaming threads, at least 1 (default is 20).
     - --version: Displays the program's version and exits.
 
     Returns:
@@ -278,6 +601,14 @@ def parse_args():
         help="Starting index for numbering (default: 1)",
     )
 
+    parser.add_argument(
+        "-t",
+        "--threads",
+        default=20,
+        type=positive_int,
+        help="Number of threads used for renaming (default: 20)",
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -299,12 +630,17 @@ def main():
     """Entry point for CLI."""
     args = parse_args()
 
-    if not args.path.exists():
-        print(f"Path {args.path} doesn't exist", file=sys.stderr)
-        sys.exit(1)
-    elif not os.access(args.path, os.R_OK):
-        print(f"No permission to read {args.path}", file=sys.stderr)
-        sys.exit(1)
+    # A single access() call covers the common case; the separate checks
+    # only run when it fails, to report what exactly is wrong
+    writable = os.access(args.path, os.R_OK | os.W_OK)
+
+    if not writable:
+        if not args.path.exists():
+            print(f"Path {args.path} doesn't exist", file=sys.stderr)
+            sys.exit(1)
+        elif not os.access(args.path, os.R_OK):
+            print(f"No permission to read {args.path}", file=sys.stderr)
+            sys.exit(1)
 
     files = find_files(args.path, args.extension)
 
@@ -318,7 +654,7 @@ def main():
 
     conflicts = validate_rename_plan(plan)
 
-    show_preview(plan)
+    show_preview(plan, conflicts)
 
     if args.dry_run:
         print("\n[Dry run] No files were renamed.")
@@ -332,12 +668,12 @@ def main():
     elif not confirm_action():
         sys.exit(0)
 
-    if not os.access(args.path, os.W_OK):
+    if not writable:
         print(f"No permission to write {args.path}", file=sys.stderr)
         sys.exit(1)
 
-    conflicted_pairs = {(old, new) for old, new, _ in conflicts}
-    effective_ops = [(old, new) for old, new in plan if (old, new) not in conflicted_pairs]
+    conflicted_sources = {old for old, _, _ in conflicts}
+    effective_ops = [(old, new) for old, new in plan if old not in conflicted_sources]
 
     if not effective_ops:
         print("Nothing to rename. All operations are conflics.")
@@ -345,7 +681,8 @@ def main():
 
     save_backup(effective_ops, args.path)
 
-    execute_rename(effective_ops)
+    # Conflicts were already filtered out of effective_ops
+    execute_rename(effective_ops, conflicts=[], threads=args.threads)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,19 @@
+import errno
+import os
 from pathlib import Path
 
 import pytest
 
 from bulk_rename.cli import (
+    apply_plan,
+    compile_pattern,
     confirm_action,
     execute_rename,
     find_files,
     generate_new_name,
     generate_rename_plan,
+    list_directory,
+    parse_args,
     save_backup,
     show_preview,
     sort_files,
@@ -39,6 +45,24 @@ def test_generate_new_name_large_number():
     assert result == "track_999.mp3"
 
 
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        pytest.param("track_{:03d}", id="padded"),
+        pytest.param("{}_track", id="leading_placeholder"),
+        pytest.param("{{literal}}_{0:02d}", id="escaped_braces"),
+        pytest.param("track_{0!s}", id="conversion"),
+        pytest.param("track", id="no_placeholder"),
+    ],
+)
+def test_compile_pattern_matches_format(pattern):
+    """Test that a compiled pattern builds the same names as generate_new_name."""
+    make_name = compile_pattern(pattern)
+
+    for index in (0, 7, 1234):
+        assert make_name(index, "mp4") == generate_new_name(pattern, index, "mp4")
+
+
 def test_find_files(tmp_path):
     """Test finding files with a specific extension in directory."""
     (tmp_path / "video1.mp4").touch()
@@ -50,6 +74,35 @@ def test_find_files(tmp_path):
     assert set(result) == {tmp_path / "video1.mp4", tmp_path / "video2.mp4"}
 
 
+def test_find_files_skips_directories(tmp_path):
+    """Test that directories matching the extension are not returned."""
+    (tmp_path / "video1.mp4").touch()
+    (tmp_path / "folder.mp4").mkdir()
+
+    result = find_files(tmp_path, "mp4")
+
+    assert result == [tmp_path / "video1.mp4"]
+
+
+def test_find_files_not_a_directory(tmp_path):
+    """Test that a missing directory or a file path yields no files."""
+    (tmp_path / "video1.mp4").touch()
+
+    assert find_files(tmp_path / "missing", "mp4") == []
+    assert find_files(tmp_path / "video1.mp4", "mp4") == []
+
+
+def test_find_files_case_insensitive_platform(tmp_path, monkeypatch):
+    """Test that extensions match regardless of case where paths are case-insensitive."""
+    (tmp_path / "video1.MP4").touch()
+    (tmp_path / "video2.mp4").touch()
+
+    monkeypatch.setattr(os.path, "normcase", str.lower)
+    result = find_files(tmp_path, "mp4")
+
+    assert set(result) == {tmp_path / "video1.MP4", tmp_path / "video2.mp4"}
+
+
 def test_sort_files_starting_letters():
     """Test sorting files with different starting letters."""
     files = [
@@ -207,6 +260,23 @@ def test_generate_rename_plan_same_directory():
     ]
 
 
+def test_generate_rename_plan_extension_edge_cases():
+    """Test that extensions follow Path.suffix for dotfiles and multi-dot names."""
+    files = [
+        Path("tmp/archive.tar.gz"),
+        Path("tmp/.hidden"),
+        Path("/noext"),
+    ]
+
+    result = generate_rename_plan(files, "file_{:02d}", 1)
+
+    assert result == [
+        (Path("tmp/archive.tar.gz"), Path("tmp/file_01.gz")),
+        (Path("tmp/.hidden"), Path("tmp/file_02.")),
+        (Path("/noext"), Path("/file_03.")),
+    ]
+
+
 def test_validate_rename_plan_no_conflicts(tmp_path):
     """All files exist, no target conflicts."""
     (tmp_path / "a.mp4").touch()
@@ -253,6 +323,113 @@ def test_validate_rename_plan_one_error_per_operation(tmp_path):
     assert len(conflicts) == 1
 
 
+def test_validate_rename_plan_shared_directory(tmp_path):
+    """Several operations in one directory are checked against a single listing."""
+    (tmp_path / "a.mp4").touch()
+    (tmp_path / "b.mp4").touch()
+    (tmp_path / "video_002.mp4").touch()
+
+    plan = [
+        (tmp_path / "a.mp4", tmp_path / "video_001.mp4"),
+        (tmp_path / "b.mp4", tmp_path / "video_002.mp4"),
+        (tmp_path / "c.mp4", tmp_path / "video_003.mp4"),
+    ]
+
+    conflicts = validate_rename_plan(plan)
+
+    assert conflicts == [
+        (tmp_path / "b.mp4", tmp_path / "video_002.mp4", "Target file already exists"),
+        (tmp_path / "c.mp4", tmp_path / "video_003.mp4", "Source file is not found"),
+    ]
+
+
+def test_validate_rename_plan_free_targets(tmp_path):
+    """Only missing sources are reported when no target name is taken."""
+    (tmp_path / "a.mp4").touch()
+    (tmp_path / "b.mp4").touch()
+
+    plan = [
+        (tmp_path / "a.mp4", tmp_path / "video_001.mp4"),
+        (tmp_path / "b.mp4", tmp_path / "video_002.mp4"),
+        (tmp_path / "c.mp4", tmp_path / "video_003.mp4"),
+    ]
+
+    conflicts = validate_rename_plan(plan)
+
+    assert conflicts == [
+        (tmp_path / "c.mp4", tmp_path / "video_003.mp4", "Source file is not found"),
+    ]
+
+
+def test_validate_rename_plan_relative_paths(tmp_path, monkeypatch):
+    """Bare relative names are checked against the current directory."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.mp4").touch()
+    (tmp_path / "video_002.mp4").touch()
+
+    plan = [
+        (Path("a.mp4"), Path("video_001.mp4")),
+        (Path("b.mp4"), Path("video_002.mp4")),
+    ]
+
+    conflicts = validate_rename_plan(plan)
+
+    assert conflicts == [
+        (Path("b.mp4"), Path("video_002.mp4"), "Source file is not found"),
+    ]
+
+
+def test_validate_rename_plan_case_only_collision(tmp_path, monkeypatch):
+    """A target listed under different case, as on a case-insensitive filesystem, is taken."""
+    (tmp_path / "a.mp4").touch()
+    (tmp_path / "b.mp4").touch()
+    (tmp_path / "video_001.mp4").touch()
+    (tmp_path / "sub").mkdir()
+
+    # A case-insensitive filesystem lists the stored name, not the one asked for
+    monkeypatch.setattr(
+        "bulk_rename.cli.list_directory", lambda directory: {"a.mp4", "b.mp4", "VIDEO_001.mp4"}
+    )
+
+    plan = [
+        (tmp_path / "a.mp4", tmp_path / "video_001.mp4"),
+        (tmp_path / "b.mp4", tmp_path / "sub" / "video_002.mp4"),
+    ]
+
+    conflicts = validate_rename_plan(plan)
+
+    assert conflicts == [
+        (tmp_path / "a.mp4", tmp_path / "video_001.mp4", "Target file already exists"),
+    ]
+
+
+def test_validate_rename_plan_case_only_collision_same_directory(tmp_path, monkeypatch):
+    """A case-only match keeps a single-directory plan from skipping its target checks."""
+    (tmp_path / "a.mp4").touch()
+    (tmp_path / "b.mp4").touch()
+    (tmp_path / "video_002.mp4").touch()
+
+    monkeypatch.setattr(
+        "bulk_rename.cli.list_directory", lambda directory: {"a.mp4", "b.mp4", "VIDEO_002.mp4"}
+    )
+
+    plan = [
+        (tmp_path / "a.mp4", tmp_path / "video_001.mp4"),
+        (tmp_path / "b.mp4", tmp_path / "video_002.mp4"),
+    ]
+
+    conflicts = validate_rename_plan(plan)
+
+    assert conflicts == [
+        (tmp_path / "b.mp4", tmp_path / "video_002.mp4", "Target file already exists"),
+    ]
+
+
+def test_list_directory_missing(tmp_path):
+    """Test listing a directory that doesn't exist."""
+    assert list_directory(tmp_path / "missing") == set()
+
+
 def test_show_preview_success(capsys, tmp_path):
     """Test showing preview without conflicts."""
     (tmp_path / "a.mp4").touch()
@@ -291,6 +468,19 @@ def test_show_preview_conflicts(capsys, tmp_path):
     )
 
 
+def test_show_preview_terminal_chunks(capsys, monkeypatch, tmp_path):
+    """Test that chunked terminal output matches the single-write output."""
+    monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+    monkeypatch.setattr("bulk_rename.cli.PREVIEW_CHUNK_LINES", 2)
+
+    plan = [(tmp_path / f"{i}.mp4", tmp_path / f"video_{i:03d}.mp4") for i in range(3)]
+
+    show_preview(plan, conflicts=[])
+    captured = capsys.readouterr()
+
+    assert captured.out == "".join(f"✅ {old} -> {new}\n" for old, new in plan)
+
+
 def test_show_preview_empty(capsys):
     """Test showing preview for zero operations."""
     plan = []
@@ -301,6 +491,17 @@ def test_show_preview_empty(capsys):
     assert captured.out == ""
 
 
+def test_show_preview_precomputed_conflicts(capsys, tmp_path):
+    """Test that precomputed conflicts are used instead of validating again."""
+    plan = [(tmp_path / "a.mp4", tmp_path / "video_001.mp4")]
+    conflicts = [(tmp_path / "a.mp4", tmp_path / "video_001.mp4", "Custom error")]
+
+    show_preview(plan, conflicts)
+    captured = capsys.readouterr()
+
+    assert captured.out == f"❌ {tmp_path}/a.mp4 -> {tmp_path}/video_001.mp4 [Custom error]\n"
+
+
 @pytest.mark.parametrize(
     "user_input, expected",
     [
@@ -316,6 +517,7 @@ def test_show_preview_empty(capsys):
         pytest.param("NO", False, id="NO"),
         pytest.param("nO", False, id="no_mixed"),
         pytest.param(" No ", False, id="no_spaces"),
+        pytest.param("yeſ", False, id="yes_long_s"),
         pytest.param("blabla", False, id="invalid"),
         pytest.param("", False, id="empty"),
     ],
@@ -326,6 +528,31 @@ def test_confirm_action(monkeypatch, user_input, expected):
     assert confirm_action() is expected
 
 
+def test_parse_args_threads(monkeypatch):
+    """Test the default and an explicit thread count."""
+    monkeypatch.setattr("sys.argv", ["bulk-rename", "-d", ".", "-p", "v_{:03d}", "-e", "mp4"])
+    assert parse_args().threads == 20
+
+    monkeypatch.setattr(
+        "sys.argv", ["bulk-rename", "-d", ".", "-p", "v_{:03d}", "-e", "mp4", "-t", "4"]
+    )
+    assert parse_args().threads == 4
+
+
+@pytest.mark.parametrize("threads", ["0", "-1", "many"])
+def test_parse_args_invalid_threads(monkeypatch, capsys, threads):
+    """Test that a thread count below 1 or not a number is rejected."""
+    monkeypatch.setattr(
+        "sys.argv", ["bulk-rename", "-d", ".", "-p", "v_{:03d}", "-e", "mp4", "-t", threads]
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args()
+
+    assert exc_info.value.code == 2
+    assert "--threads" in capsys.readouterr().err
+
+
 def test_save_backup_nonempty(tmp_path):
     """Test saving two operations to a backup file."""
     plan = [
@@ -341,6 +568,17 @@ def test_save_backup_nonempty(tmp_path):
     )
 
 
+def test_save_backup_chunked(tmp_path, monkeypatch):
+    """Test that a plan larger than one chunk is written completely and in order."""
+    monkeypatch.setattr("bulk_rename.cli.BACKUP_CHUNK_ROWS", 2)
+
+    plan = [(Path(f"tmp/{i}.mp4"), Path(f"tmp/video_{i:03d}.mp4")) for i in range(5)]
+
+    backup_file = save_backup(plan, tmp_path)
+
+    assert backup_file.read_text() == "".join(f"{old} -> {new}\n" for old, new in plan)
+
+
 def test_save_backup_empty(tmp_path):
     """Test saving zero operations to a backup file."""
     plan = []
@@ -398,3 +636,111 @@ def test_execute_rename_empty(capsys):
     captured = capsys.readouterr()
 
     assert captured.out == ""
+
+
+def test_execute_rename_os_error(tmp_path, capsys, monkeypatch):
+    """Test that a failed rename is reported as skipped instead of aborting."""
+    (tmp_path / "a.mp4").touch()
+
+    def deny(src, dst):
+        raise PermissionError(errno.EACCES, "Permission denied")
+
+    monkeypatch.setattr("bulk_rename.cli.rename_batch", lambda plan: None)
+    monkeypatch.setattr("os.rename", deny)
+
+    plan = [(tmp_path / "a.mp4", tmp_path / "video_001.mp4")]
+
+    execute_rename(plan)
+    captured = capsys.readouterr()
+
+    assert (tmp_path / "a.mp4").exists()
+    assert captured.out == (
+        f"⚠️ [SKIPPED] {tmp_path}/a.mp4 -> {tmp_path}/video_001.mp4 [Permission denied]\n"
+    )
+
+
+def test_execute_rename_threaded(tmp_path, capsys, monkeypatch):
+    """Test executing a plan large enough to use the thread pool."""
+    monkeypatch.setattr("bulk_rename.cli.rename_batch", lambda plan: None)
+
+    plan = []
+    for i in range(20):
+        (tmp_path / f"{i}.mp4").touch()
+        plan.append((tmp_path / f"{i}.mp4", tmp_path / f"video_{i:03d}.mp4"))
+
+    execute_rename(plan, threads=4)
+    captured = capsys.readouterr()
+
+    assert sorted(tmp_path.iterdir()) == sorted(new for _, new in plan)
+    assert captured.out == ""
+
+
+def test_execute_rename_precomputed_conflicts(tmp_path, capsys):
+    """Test that an empty conflict list skips validation of an already filtered plan."""
+    (tmp_path / "a.mp4").touch()
+
+    plan = [(tmp_path / "a.mp4", tmp_path / "video_001.mp4")]
+
+    execute_rename(plan, conflicts=[])
+    captured = capsys.readouterr()
+
+    assert (tmp_path / "video_001.mp4").exists()
+    assert captured.out == ""
+
+
+def test_execute_rename_uses_given_conflicts(tmp_path, capsys):
+    """Test that given conflicts are skipped without validating the plan again."""
+    (tmp_path / "a.mp4").touch()
+
+    plan = [(tmp_path / "a.mp4", tmp_path / "video_001.mp4")]
+    conflicts = [(tmp_path / "a.mp4", tmp_path / "video_001.mp4", "Custom error")]
+
+    execute_rename(plan, conflicts=conflicts)
+    captured = capsys.readouterr()
+
+    assert (tmp_path / "a.mp4").exists()
+    assert captured.out == (
+        f"⚠️ [SKIPPED] {tmp_path}/a.mp4 -> {tmp_path}/video_001.mp4 [Custom error]\n"
+    )
+
+
+def test_apply_plan_reports_errors(tmp_path, monkeypatch):
+    """Test that apply_plan returns one errno per operation in plan order."""
+    monkeypatch.setattr("bulk_rename.cli.rename_batch", lambda plan: None)
+
+    plan = []
+    for i in range(10):
+        if i != 3:
+            (tmp_path / f"{i}.mp4").touch()
+        plan.append((tmp_path / f"{i}.mp4", tmp_path / f"video_{i:03d}.mp4"))
+
+    errors = apply_plan(plan, threads=4)
+
+    assert errors == [0, 0, 0, errno.ENOENT, 0, 0, 0, 0, 0, 0]
+    assert (tmp_path / "video_000.mp4").exists()
+
+
+def test_apply_plan_renames_what_io_uring_did_not_reach(tmp_path, monkeypatch):
+    """Test that operations left over by a failing ring are renamed serially."""
+
+    def partial_batch(plan):
+        old_path, new_path = plan[0]
+        old_path.rename(new_path)
+        return [0]
+
+    monkeypatch.setattr("bulk_rename.cli.rename_batch", partial_batch)
+
+    (tmp_path / "a.mp4").touch()
+    (tmp_path / "b.mp4").touch()
+
+    plan = [
+        (tmp_path / "a.mp4", tmp_path / "video_001.mp4"),
+        (tmp_path / "b.mp4", tmp_path / "video_002.mp4"),
+        (tmp_path / "c.mp4", tmp_path / "video_003.mp4"),
+    ]
+
+    errors = apply_plan(plan)
+
+    assert errors == [0, 0, errno.ENOENT]
+    assert (tmp_path / "video_001.mp4").exists()
+    assert (tmp_path / "video_002.mp4").exists()
@@ -0,0 +1,56 @@
+import errno
+
+import pytest
+
+from bulk_rename._uring import QUEUE_DEPTH, _load_liburing, rename_batch
+
+pytestmark = pytest.mark.skipif(_load_liburing() is None, reason="liburing-ffi is not installed")
+
+
+def rename_or_skip(plan):
+    """Run rename_batch, skipping the test when the kernel lacks IORING_OP_RENAMEAT."""
+    errors = rename_batch(plan)
+
+    if errors is None:
+        pytest.skip("io_uring renameat is not available")
+
+    return errors
+
+
+def test_rename_batch_errno_per_operation(tmp_path):
+    """Test that each operation gets its own errno, in plan order."""
+    (tmp_path / "a.mp4").touch()
+    (tmp_path / "c.mp4").touch()
+    (tmp_path / "sub").mkdir()
+
+    plan = [
+        (tmp_path / "a.mp4", tmp_path / "video_001.mp4"),
+        (tmp_path / "b.mp4", tmp_path / "video_002.mp4"),
+        (tmp_path / "c.mp4", tmp_path / "sub" / "video_003.mp4"),
+    ]
+
+    errors = rename_or_skip(plan)
+
+    assert errors == [0, errno.ENOENT, 0]
+    assert (tmp_path / "video_001.mp4").exists()
+    assert (tmp_path / "sub" / "video_003.mp4").exists()
+    assert not (tmp_path / "a.mp4").exists()
+    assert not (tmp_path / "c.mp4").exists()
+
+
+def test_rename_batch_several_batches(tmp_path):
+    """Test a plan larger than the queue depth."""
+    plan = []
+    for i in range(QUEUE_DEPTH * 2 + 1):
+        (tmp_path / f"{i}.mp4").touch()
+        plan.append((tmp_path / f"{i}.mp4", tmp_path / f"video_{i:03d}.mp4"))
+
+    errors = rename_or_skip(plan)
+
+    assert errors == [0] * len(plan)
+    assert all(new_path.exists() for _, new_path in plan)
+
+
+def test_rename_batch_empty_plan():
+    """Test that an empty plan is left to the caller."""
+    assert rename_batch([]) is None